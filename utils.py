@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import math
 import re
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Union
 from difflib import SequenceMatcher
 
 
@@ -12,9 +14,18 @@ def normalize_text(value: Optional[str]) -> Optional[str]:
     return re.sub(r"\s+", " ", value).strip().lower()
 
 
-def parse_currency(value: Optional[str]) -> Optional[float]:
+def parse_currency(value: Optional[Union[str, float]]) -> Optional[float]:
     if value is None:
         return None
+    # Already numeric (typical for API amounts): nothing to strip or re-parse; NaN/inf mean missing
+    if isinstance(value, float):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, int) and not isinstance(value, bool):
+        try:
+            return float(value)
+        except OverflowError:
+            # Too large for a float: as unusable as inf
+            return None
     text = str(value)
     
     # Remove all currency symbols including ¥, $, €, ₹, etc.
@@ -72,24 +83,32 @@ def parse_int(value: Optional[str]) -> Optional[int]:
         return None
 
 
+# Try multiple common formats
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m-%d-%Y",
+    "%m/%d/%Y",
+    "%d-%b-%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+)
+
+
 def parse_date(value: Optional[str]) -> Optional[datetime.date]:
     if value is None:
         return None
     text = str(value).strip()
     if not text:
         return None
-    # Try multiple common formats
-    formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d/%m/%Y",
-        "%m-%d-%Y",
-        "%m/%d/%Y",
-        "%d-%b-%Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M:%S.%f",
-    ]
-    for fmt in formats:
+    return _parse_date_text(text)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_text(text: str) -> Optional[datetime.date]:
+    # Quotes share a handful of dates, and each miss costs several strptime attempts
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(text, fmt).date()
         except ValueError:
@@ -97,18 +116,29 @@ def parse_date(value: Optional[str]) -> Optional[datetime.date]:
     return None
 
 
+# API payloads are plain JSON, so amounts are exactly int or float. Test with
+# type(x) in _NUMERIC_TYPES: it is cheaper than isinstance() and keeps bools and
+# subclasses such as numpy.float64 on the coercing float() paths.
+_NUMERIC_TYPES = (int, float)
+
+
 def floats_match(a: Optional[float], b: Optional[float], tolerance: float) -> bool:
-    if a is None and b is None:
-        return True
-    if a is None or b is None:
-        # Treat None/null and 0.0 as equivalent
-        if a is None:
-            return abs(float(b)) <= tolerance
-        if b is None:
-            return abs(float(a)) <= tolerance
-    # Round to 2 decimals to minimize OCR rounding drift
-    a_ = round(float(a), 2)
-    b_ = round(float(b), 2)
+    # Fast path: both sides already plain numbers, skip the None handling and float() coercion
+    if type(a) in _NUMERIC_TYPES and type(b) in _NUMERIC_TYPES:
+        a_ = round(a, 2)
+        b_ = round(b, 2)
+    else:
+        if a is None and b is None:
+            return True
+        if a is None or b is None:
+            # Treat None/null and 0.0 as equivalent
+            if a is None:
+                return abs(float(b)) <= tolerance
+            if b is None:
+                return abs(float(a)) <= tolerance
+        # Round to 2 decimals to minimize OCR rounding drift
+        a_ = round(float(a), 2)
+        b_ = round(float(b), 2)
     if abs(a_ - b_) <= tolerance:
         return True
     # Relative tolerance backup
@@ -235,28 +265,67 @@ def strings_contain_match(a: Optional[str], b: Optional[str], *, extract_numbers
         return True
     
     # If extract_numbers is True, extract numeric identifiers and compare
-    if extract_numbers:
-        # Extract all numeric sequences from both strings
-        a_numbers = re.findall(r'\d+', na)
-        b_numbers = re.findall(r'\d+', nb)
-        
-        # If both have numbers, check if any match
-        if a_numbers and b_numbers:
-            # Check if any number from a is in b, or vice versa
-            for num_a in a_numbers:
-                if num_a in b_numbers:
-                    return True
-            # Also check if the number appears in the other string
-            for num_a in a_numbers:
-                if num_a in nb:
-                    return True
-            for num_b in b_numbers:
-                if num_b in na:
-                    return True
+    if extract_numbers and _numbers_overlap(na, nb):
+        return True
+    
+    return False
+
+
+def _numbers_overlap(na: str, nb: str) -> bool:
+    """Check whether the numeric identifiers of two stripped strings overlap."""
+    # Extract all numeric sequences from both strings
+    a_numbers = re.findall(r'\d+', na)
+    b_numbers = re.findall(r'\d+', nb)
     
+    # If both have numbers, check if any match
+    if a_numbers and b_numbers:
+        # Check if any number from a is in b, or vice versa
+        for num_a in a_numbers:
+            if num_a in b_numbers:
+                return True
+        # Also check if the number appears in the other string
+        for num_a in a_numbers:
+            if num_a in nb:
+                return True
+        for num_b in b_numbers:
+            if num_b in na:
+                return True
     return False
 
 
+def strings_match(a: Optional[str], b: Optional[str], *, threshold: float = 0.9, extract_numbers: bool = True) -> bool:
+    """Lenient text comparison: containment/key phrases/numbers first, then similarity.
+    
+    Equivalent to ``strings_contain_match(a, b, extract_numbers=...) or
+    strings_close(a, b, threshold=...)``, but both inputs are normalized only once.
+    """
+    if a is None or b is None:
+        # strings_close treats two missing values as equal
+        return a is None and b is None
+    
+    na = str(a).strip()
+    nb = str(b).strip()
+    na_lower = na.lower()
+    nb_lower = nb.lower()
+    
+    if na_lower and nb_lower:
+        if na_lower in nb_lower or nb_lower in na_lower:
+            return True
+        if strings_share_key_phrases(na, nb, min_shared_words=2):
+            return True
+        if extract_numbers and _numbers_overlap(na, nb):
+            return True
+    
+    # Fall back to similarity on whitespace-collapsed text (same as normalize_text)
+    ca = re.sub(r"\s+", " ", na_lower)
+    cb = re.sub(r"\s+", " ", nb_lower)
+    if ca == cb:
+        return True
+    if not ca or not cb:
+        return False
+    return SequenceMatcher(None, ca, cb).ratio() >= threshold
+
+
 def only_digits(text: Optional[str]) -> Optional[str]:
     if text is None:
         return None
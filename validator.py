@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, NamedTuple
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, NamedTuple, Tuple
 
 from config import AppConfig
-from utils import floats_match, strings_equal, strings_close, strings_contain_match, parse_currency, parse_date, only_digits, parse_percentage
+from utils import _NUMERIC_TYPES, floats_match, strings_equal, strings_close, strings_contain_match, strings_match, parse_currency, parse_date, only_digits, parse_percentage
 
 
-@dataclass
+# Section labels as shared named constants; consumers compare sections by equality,
+# and FieldResults built in other modules use their own literals
+_SEC_HEADER, _SEC_LINES, _SEC_CALCULATIONS, _SEC_GRAND_TOTALS, _SEC_QUOTE_INFO = map(
+    sys.intern, ("Header", "Lines", "Calculations", "Grand Totals", "Quote Information")
+)
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 results keep a regular __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class FieldResult:
     field_name: str
     section: str
@@ -18,7 +30,7 @@ class FieldResult:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     overall_status: str
     total_checked: int
@@ -36,16 +48,26 @@ class ExtendedField(NamedTuple):
     threshold: float = 0.9
 
 
+_SCALAR_KEYS = ("displayValue", "value", "display", "code", "name")
+_EMPTY = (None, "")
+
+
 def _normalize_scalar(value: Any) -> Any:
     if isinstance(value, dict):
-        for key in ("displayValue", "value", "display", "code", "name"):
-            if key in value and value[key] not in (None, ""):
-                return value[key]
+        get = value.get
+        for key in _SCALAR_KEYS:
+            inner = get(key)
+            if inner not in _EMPTY:
+                return inner
         if len(value) == 1:
             return next(iter(value.values()))
     return value
 
 
+_BOOL_TRUE = frozenset({"true", "yes", "y", "1", "t"})
+_BOOL_FALSE = frozenset({"false", "no", "n", "0", "f"})
+
+
 def _to_bool(value: Any) -> Optional[bool]:
     if isinstance(value, bool):
         return value
@@ -57,9 +79,9 @@ def _to_bool(value: Any) -> Optional[bool]:
         return None
     if isinstance(value, str):
         normalized = value.strip().lower()
-        if normalized in {"true", "yes", "y", "1", "t"}:
+        if normalized in _BOOL_TRUE:
             return True
-        if normalized in {"false", "no", "n", "0", "f"}:
+        if normalized in _BOOL_FALSE:
             return False
     return None
 
@@ -87,6 +109,53 @@ def _to_string(value: Any) -> Optional[str]:
     return text or None
 
 
+def _pick_display(data: Dict[str, Any], key: str, subkey: str = "displayValue") -> Any:
+    """Return ``data[key]``, or its ``subkey`` entry when the API wraps it in a dict."""
+    val = data.get(key)
+    if isinstance(val, dict):
+        return val.get(subkey)
+    return val
+
+
+def _unwrap(data: Dict[str, Any], keys: tuple[str, ...], *, allow_zero: bool = True, allow_bare: bool = True) -> Any:
+    """Return the first usable value among ``keys``.
+
+    CPQ amounts come either as ``{"value": ...}`` wrappers or as bare numbers.
+    A wrapper wins as soon as its value is set; a bare number wins unless it is
+    zero and ``allow_zero`` is False, or bare numbers are disabled with
+    ``allow_bare=False``."""
+    for key in keys:
+        val = data.get(key)
+        if val is None:
+            # Missing/null keys are the common case on lean payloads
+            continue
+        if isinstance(val, dict):
+            inner = val.get("value")
+            if inner is not None:
+                return inner
+        elif allow_bare and type(val) in _NUMERIC_TYPES and (allow_zero or val != 0):
+            return val
+    return None
+
+
+def _first_not_none(*vals: Any) -> Any:
+    """Return the first argument that is not None (0 and "" still count)."""
+    for val in vals:
+        if val is not None:
+            return val
+    return None
+
+
+# Candidate API keys, in priority order, for amounts probed with _unwrap
+_LIST_TOTAL_KEYS = ("quoteListPrice_t_c", "totalOneTimeListAmount_t", "totalListPrice_t_c")
+_ULP_KEYS = ("_price_item_price_each", "_price_unit_price_each", "_price_list_price_each")
+_XLP_KEYS = ("_price_extended_price", "extendedListPrice", "listAmount_l")
+_XNP_KEYS = ("netAmount_l", "netAmountRollup_l", "netPriceRollup_l", "extendedNetPriceUSD_l_c", "rollUpNetPrice_l_c")
+
+
+_NONE_STR_SENTINELS = frozenset({"", "none", "null", "n/a", "na", "-", "--"})
+
+
 def _is_pdf_value_none(pdf_val: Any) -> bool:
     """Check if PDF value is None, empty, or the string 'None'.
     Returns True if the value should be considered as missing/not present in PDF.
@@ -94,15 +163,10 @@ def _is_pdf_value_none(pdf_val: Any) -> bool:
     if pdf_val is None:
         return True
     if isinstance(pdf_val, str):
-        normalized = pdf_val.strip().lower()
-        if normalized in ("", "none", "null", "n/a", "na", "-", "--"):
-            return True
+        return pdf_val.strip().lower() in _NONE_STR_SENTINELS
     # For numeric types, 0 might be valid, but None/empty string means missing
-    if isinstance(pdf_val, (int, float)):
-        # Only consider it None if it's explicitly None or NaN
-        if pdf_val != pdf_val:  # NaN check
-            return True
-    return False
+    # Only consider it None if it's explicitly None or NaN (ints can't be NaN)
+    return isinstance(pdf_val, float) and pdf_val != pdf_val
 
 
 EXTENDED_FIELDS: List[ExtendedField] = [
@@ -190,60 +254,125 @@ EXTENDED_FIELDS: List[ExtendedField] = [
 ]
 
 
-def _evaluate_extended_field(field: ExtendedField, api_val: Any, doc_val: Any, config: AppConfig) -> tuple[Any, Any, bool]:
-    if field.kind == "bool":
-        api_bool = _to_bool(api_val)
-        doc_bool = _to_bool(doc_val)
-        expected = api_bool
-        found = doc_bool
-        if api_bool is None and doc_bool is None:
-            match = True
-        elif api_bool is not None and doc_bool is not None:
-            match = api_bool == doc_bool
-        else:
-            match = False
-        return expected, found, match
-
-    if field.kind == "currency":
-        api_num = _to_float(api_val)
-        doc_num = _to_float(doc_val)
-        expected = round(api_num, 2) if api_num is not None else None
-        found = round(doc_num, 2) if doc_num is not None else None
-        match = floats_match(api_num, doc_num, config.validation_rules.numeric_tolerance)
-        return expected, found, match
-
-    if field.kind == "numeric":
-        api_num = _to_float(api_val)
-        doc_num = _to_float(doc_val)
-        expected = api_num
-        found = doc_num
-        match = floats_match(api_num, doc_num, config.validation_rules.numeric_tolerance)
-        return expected, found, match
-
-    if field.kind == "percent":
-        api_pct = _to_percent(api_val)
-        doc_pct = _to_percent(doc_val)
-        expected = round(api_pct, 2) if api_pct is not None else None
-        found = round(doc_pct, 2) if doc_pct is not None else None
-        match = floats_match(api_pct, doc_pct, config.validation_rules.percentage_tolerance)
-        return expected, found, match
-
-    if field.kind == "date":
-        api_date = parse_date(api_val)
-        doc_date = parse_date(doc_val)
-        expected = api_val
-        found = doc_val
-        match = api_date == doc_date if (api_date is not None or doc_date is not None) else True
-        return expected, found, match
+def _eval_bool(api_val: Any, doc_val: Any, config: AppConfig, threshold: float) -> tuple[Any, Any, bool]:
+    api_bool = _to_bool(api_val)
+    doc_bool = _to_bool(doc_val)
+    if api_bool is None and doc_bool is None:
+        match = True
+    elif api_bool is not None and doc_bool is not None:
+        match = api_bool == doc_bool
+    else:
+        match = False
+    return api_bool, doc_bool, match
+
+
+def _eval_currency(api_val: Any, doc_val: Any, config: AppConfig, threshold: float) -> tuple[Any, Any, bool]:
+    api_num = _to_float(api_val)
+    doc_num = _to_float(doc_val)
+    expected = round(api_num, 2) if api_num is not None else None
+    found = round(doc_num, 2) if doc_num is not None else None
+    match = floats_match(api_num, doc_num, config.validation_rules.numeric_tolerance)
+    return expected, found, match
+
 
+def _eval_numeric(api_val: Any, doc_val: Any, config: AppConfig, threshold: float) -> tuple[Any, Any, bool]:
+    api_num = _to_float(api_val)
+    doc_num = _to_float(doc_val)
+    match = floats_match(api_num, doc_num, config.validation_rules.numeric_tolerance)
+    return api_num, doc_num, match
+
+
+def _eval_percent(api_val: Any, doc_val: Any, config: AppConfig, threshold: float) -> tuple[Any, Any, bool]:
+    api_pct = _to_percent(api_val)
+    doc_pct = _to_percent(doc_val)
+    expected = round(api_pct, 2) if api_pct is not None else None
+    found = round(doc_pct, 2) if doc_pct is not None else None
+    match = floats_match(api_pct, doc_pct, config.validation_rules.percentage_tolerance)
+    return expected, found, match
+
+
+def _eval_date(api_val: Any, doc_val: Any, config: AppConfig, threshold: float) -> tuple[Any, Any, bool]:
+    api_date = parse_date(api_val)
+    doc_date = parse_date(doc_val)
+    match = api_date == doc_date if (api_date is not None or doc_date is not None) else True
+    return api_val, doc_val, match
+
+
+def _eval_string(api_val: Any, doc_val: Any, config: AppConfig, threshold: float) -> tuple[Any, Any, bool]:
     # Default string / picklist comparison with containment matching
     api_str = _to_string(api_val)
     doc_str = _to_string(doc_val)
-    expected = api_str
-    found = doc_str
     # Use containment matching first (more lenient), then fall back to similarity
-    match = strings_contain_match(api_str, doc_str, extract_numbers=True) or strings_close(api_str, doc_str, threshold=field.threshold)
-    return expected, found, match
+    match = strings_match(api_str, doc_str, threshold=threshold)
+    return api_str, doc_str, match
+
+
+# (api_val, doc_val, config, threshold) -> (expected, found, match)
+_Evaluator = Callable[[Any, Any, AppConfig, float], Tuple[Any, Any, bool]]
+
+_KIND_HANDLERS: Dict[str, _Evaluator] = {
+    "bool": _eval_bool,
+    "currency": _eval_currency,
+    "numeric": _eval_numeric,
+    "percent": _eval_percent,
+    "date": _eval_date,
+    "string": _eval_string,
+    "picklist": _eval_string,
+}
+
+# Resolved once at import: (name, section, handler, threshold) per extended field
+_EXT_FLAT: Tuple[Tuple[str, str, _Evaluator, float], ...] = tuple(
+    (name, sys.intern(section), _KIND_HANDLERS.get(kind, _eval_string), threshold)
+    for name, section, kind, threshold in EXTENDED_FIELDS
+)
+
+
+# Quote Information attributes compared as text: (field, label)
+_ADDITIONAL_HEADER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("freightTerms_t_c", "Freight Terms"),
+    ("contractStartDate_t", "Contract Start Date"),
+    ("contractEndDate_t", "Contract End Date"),
+    ("lastUpdatedDate_t", "Last Updated Date"),
+    ("lastUpdatedBy_t", "Last Updated By"),
+    ("sellingMotion_t_c", "Selling Motion"),
+    ("district_t_c", "District"),
+)
+
+
+def _norm_header_pair(api_data: Dict[str, Any], pdf_data: Dict[str, Any], field: str) -> Tuple[Optional[str], Optional[str], bool]:
+    """Return ``(api_str, pdf_str, should_validate)`` for an additional header field."""
+    api_val = api_data.get(field)
+    if api_val is None:
+        return None, None, False
+    if isinstance(api_val, dict):
+        api_val = api_val.get("value") or api_val.get("displayValue")
+    pdf_val = pdf_data.get(field)
+    if _is_pdf_value_none(pdf_val):
+        return None, None, False
+    # pdf_val is known to be set here; the API side may still unwrap to None
+    return (str(api_val) if api_val is not None else None), str(pdf_val), True
+
+
+# Quote Information pricing attributes: (field, label, is_currency)
+_ADDITIONAL_PRICING_FIELDS: Tuple[Tuple[str, str, bool], ...] = (
+    ("extNetPrice_t_c", "Extended Net Price", True),
+    ("quoteDesiredNetPrice_t_c", "Desired Net Price", True),
+    ("quoteDesiredDiscount_t_c", "Desired Discount %", False),
+)
+
+
+def _grand_total_result(field_name: str, api_total: Optional[float], pdf_total: Any, tolerance: float, label: str) -> FieldResult:
+    expected = round(api_total, 2) if api_total is not None else None
+    found = round(pdf_total, 2) if pdf_total is not None else None
+    match = floats_match(api_total, pdf_total, tolerance)
+    return FieldResult(
+        field_name,
+        _SEC_GRAND_TOTALS,
+        expected,
+        found,
+        match,
+        message=f"CRITICAL: {label} validation" if not match else None,
+    )
 
 
 def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[str, Any], *, transaction_id: Optional[str] = None, pdf_filename: Optional[str] = None) -> ValidationResult:
@@ -254,7 +383,14 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     3. Grand Totals (List Total, Discount, Net Total)
     4. Quote Information (Additional Details: Incoterm, Contract, Payment Terms, etc.)
     """
+    # A quote typically yields ~20 header/total checks + len(EXTENDED_FIELDS)
+    # + ~4 per API line, so bind the append once instead of re-resolving it
+    # at every call site below.
     results: List[FieldResult] = []
+    add_result = results.append
+    rules = config.validation_rules
+    num_tol = rules.numeric_tolerance
+    pct_tol = rules.percentage_tolerance
 
     # ========================================================================
     # SECTION 1: HEADER SECTION (Top of Document)
@@ -266,14 +402,14 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     if not _is_pdf_value_none(pdf_quote_name):
         api_str = str(api_quote_name) if api_quote_name else None
         pdf_str = str(pdf_quote_name) if pdf_quote_name else None
-        match = strings_contain_match(api_str, pdf_str, extract_numbers=True) or strings_close(api_str, pdf_str, threshold=0.8)
-        results.append(
+        match = strings_match(api_str, pdf_str, threshold=0.8)
+        add_result(
             FieldResult(
-                field_name="quoteNameTextArea_t_c",
-                section="Header",
-                expected=api_quote_name,
-                found=pdf_quote_name,
-                match=match,
+                "quoteNameTextArea_t_c",
+                _SEC_HEADER,
+                api_quote_name,
+                pdf_quote_name,
+                match,
             )
         )
 
@@ -281,13 +417,13 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     api_created = api_data.get("createdDate_t")
     pdf_created = pdf_data.get("createdDate_t")
     if not _is_pdf_value_none(pdf_created):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="createdDate_t",
-                section="Header",
-                expected=api_created,
-                found=pdf_created,
-                match=(
+                "createdDate_t",
+                _SEC_HEADER,
+                api_created,
+                pdf_created,
+                (
                     (parse_date(api_created) == parse_date(pdf_created))
                     if (api_created or pdf_created)
                     else True
@@ -299,13 +435,13 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     api_expires = api_data.get("expiresOnDate_t_c")
     pdf_expires = pdf_data.get("expiresOnDate_t_c")
     if not _is_pdf_value_none(pdf_expires):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="expiresOnDate_t_c",
-                section="Header",
-                expected=api_expires,
-                found=pdf_expires,
-                match=(
+                "expiresOnDate_t_c",
+                _SEC_HEADER,
+                api_expires,
+                pdf_expires,
+                (
                     (parse_date(api_expires) == parse_date(pdf_expires))
                     if (api_expires or pdf_expires)
                     else True
@@ -329,20 +465,19 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     # Note: End Customer may not be in standard fields, skip if not present
 
     # 9. Quote Status
-    api_status_candidates = [
-        (api_data.get("quoteStatus_t_c") or {}).get("displayValue") if isinstance(api_data.get("quoteStatus_t_c"), dict) else api_data.get("quoteStatus_t_c"),
-        (api_data.get("status_t") or {}).get("displayValue") if isinstance(api_data.get("status_t"), dict) else api_data.get("status_t"),
-    ]
-    api_status = next((v for v in api_status_candidates if v is not None), None)
+    api_status = _first_not_none(
+        _pick_display(api_data, "quoteStatus_t_c"),
+        _pick_display(api_data, "status_t"),
+    )
     pdf_status = pdf_data.get("status_t")
     if not _is_pdf_value_none(pdf_status):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="status_t",
-                section="Header",
-                expected=api_status,
-                found=pdf_status,
-                match=strings_close(api_status, pdf_status, threshold=0.9),
+                "status_t",
+                _SEC_HEADER,
+                api_status,
+                pdf_status,
+                strings_close(api_status, pdf_status, threshold=0.9),
             )
         )
 
@@ -357,34 +492,13 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     # ========================================================================
     
     # 1. List Grand Total
-    api_list_candidates = [
-        api_data.get("quoteListPrice_t_c"),
-        api_data.get("totalOneTimeListAmount_t"),
-        api_data.get("totalListPrice_t_c"),
-    ]
-    api_list = None
-    for candidate in api_list_candidates:
-        if candidate is not None:
-            if isinstance(candidate, dict) and candidate.get("value") is not None:
-                api_list = candidate.get("value")
-                break
-            elif isinstance(candidate, (int, float)):
-                api_list = candidate
-                break
-    
+    api_list = _unwrap(api_data, _LIST_TOTAL_KEYS)
     pdf_list = pdf_data.get("quoteListPrice_t_c")
-    api_list_parsed = parse_currency(str(api_list) if api_list is not None else None)
+    api_list_parsed = parse_currency(api_list)
     
     if not _is_pdf_value_none(pdf_list):
-        results.append(
-            FieldResult(
-                field_name="quoteListPrice_t_c",
-                section="Grand Totals",
-                expected=round(api_list_parsed, 2) if api_list_parsed is not None else None,
-                found=round(pdf_list, 2) if pdf_list is not None else None,
-                match=floats_match(api_list_parsed, pdf_list, config.validation_rules.numeric_tolerance),
-                message=f"CRITICAL: List Grand Total validation" if not floats_match(api_list_parsed, pdf_list, config.validation_rules.numeric_tolerance) else None,
-            )
+        add_result(
+            _grand_total_result("quoteListPrice_t_c", api_list_parsed, pdf_list, num_tol, "List Grand Total")
         )
 
     # 2. Total Discount
@@ -399,38 +513,30 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
             pdf_disc_f = float(pdf_disc) if pdf_disc is not None else None
         except Exception:
             pdf_disc_f = None
-        results.append(
+        add_result(
             FieldResult(
-                field_name="quoteCurrentDiscount_t_c",
-                section="Grand Totals",
-                expected=api_disc_f,
-                found=pdf_disc_f,
-                match=floats_match(api_disc_f, pdf_disc_f, config.validation_rules.percentage_tolerance),
+                "quoteCurrentDiscount_t_c",
+                _SEC_GRAND_TOTALS,
+                api_disc_f,
+                pdf_disc_f,
+                floats_match(api_disc_f, pdf_disc_f, pct_tol),
             )
         )
 
     # 3. Net Grand Total
-    api_net_candidates = [
+    api_net = _first_not_none(
         api_data.get("quoteNetPrice_t_c"),
         api_data.get("extNetPrice_t_c"),
         api_data.get("netPrice_t_c"),
         api_data.get("totalOneTimeNetAmount_t"),
         api_data.get("_transaction_total"),
-    ]
-    api_net = next((v for v in api_net_candidates if v is not None), None)
-    api_net_f = parse_currency(api_net if isinstance(api_net, str) else str(api_net) if api_net is not None else None)
+    )
+    api_net_f = parse_currency(api_net)
     pdf_net_f = pdf_data.get("quoteNetPrice_t_c")
     
     if not _is_pdf_value_none(pdf_net_f):
-        results.append(
-            FieldResult(
-                field_name="quoteNetPrice_t_c",
-                section="Grand Totals",
-                expected=round(api_net_f, 2) if api_net_f is not None else None,
-                found=round(pdf_net_f, 2) if pdf_net_f is not None else None,
-                match=floats_match(api_net_f, pdf_net_f, config.validation_rules.numeric_tolerance),
-                message=f"CRITICAL: Net Grand Total validation" if not floats_match(api_net_f, pdf_net_f, config.validation_rules.numeric_tolerance) else None,
-            )
+        add_result(
+            _grand_total_result("quoteNetPrice_t_c", api_net_f, pdf_net_f, num_tol, "Net Grand Total")
         )
 
     # ========================================================================
@@ -453,20 +559,16 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     # (These may not be in standard API fields, skip if not present)
 
     # Incoterm
-    api_incoterm = (
-        (api_data.get("incoterm_t_c") or {}).get("displayValue")
-        if isinstance(api_data.get("incoterm_t_c"), dict)
-        else api_data.get("incoterm_t_c")
-    )
+    api_incoterm = _pick_display(api_data, "incoterm_t_c")
     pdf_incoterm = pdf_data.get("incoterm_t_c")
     if not _is_pdf_value_none(pdf_incoterm):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="incoterm_t_c",
-                section="Quote Information",
-                expected=api_incoterm,
-                found=pdf_incoterm,
-                match=strings_close(api_incoterm, pdf_incoterm, threshold=0.92),
+                "incoterm_t_c",
+                _SEC_QUOTE_INFO,
+                api_incoterm,
+                pdf_incoterm,
+                strings_close(api_incoterm, pdf_incoterm, threshold=0.92),
             )
         )
 
@@ -480,20 +582,16 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     # Note: May not be in standard fields, skip if not present
 
     # Order Type
-    api_order_type = (
-        (api_data.get("orderType_t_c") or {}).get("displayValue")
-        if isinstance(api_data.get("orderType_t_c"), dict)
-        else api_data.get("orderType_t_c")
-    )
+    api_order_type = _pick_display(api_data, "orderType_t_c")
     pdf_order_type = pdf_data.get("orderType_t_c")
     if not _is_pdf_value_none(pdf_order_type):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="orderType_t_c",
-                section="Quote Information",
-                expected=api_order_type,
-                found=pdf_order_type,
-                match=strings_close(api_order_type, pdf_order_type, threshold=0.92),
+                "orderType_t_c",
+                _SEC_QUOTE_INFO,
+                api_order_type,
+                pdf_order_type,
+                strings_close(api_order_type, pdf_order_type, threshold=0.92),
             )
         )
 
@@ -507,78 +605,71 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
             api_str = str(api_contract_name) if api_contract_name is not None else None
             pdf_str = str(pdf_contract_name) if pdf_contract_name is not None else None
             # Use key phrase matching (checks for shared meaningful words) with lower similarity threshold
-            match = strings_contain_match(api_str, pdf_str, extract_numbers=True) or strings_close(api_str, pdf_str, threshold=0.70)
-            results.append(
+            match = strings_match(api_str, pdf_str, threshold=0.70)
+            add_result(
                 FieldResult(
-                    field_name="contractName_t",
-                    section="Quote Information",
-                    expected=api_str,
-                    found=pdf_str,
-                    match=match,
+                    "contractName_t",
+                    _SEC_QUOTE_INFO,
+                    api_str,
+                    pdf_str,
+                    match,
                 )
             )
 
     # Payment Terms
-    api_payterms = (
-        (api_data.get("paymentTerms_t_c") or {}).get("displayValue")
-        if isinstance(api_data.get("paymentTerms_t_c"), dict)
-        else api_data.get("paymentTerms_t_c")
-    )
+    api_payterms = _pick_display(api_data, "paymentTerms_t_c")
     pdf_payterms = pdf_data.get("paymentTerms_t_c")
     if not _is_pdf_value_none(pdf_payterms):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="paymentTerms_t_c",
-                section="Quote Information",
-                expected=api_payterms,
-                found=pdf_payterms,
-                match=strings_close(api_payterms, pdf_payterms, threshold=0.92),
+                "paymentTerms_t_c",
+                _SEC_QUOTE_INFO,
+                api_payterms,
+                pdf_payterms,
+                strings_close(api_payterms, pdf_payterms, threshold=0.92),
             )
         )
 
     # Price List
-    api_pricelist = (
-        (api_data.get("priceList_t_c") or {}).get("value")
-        if isinstance(api_data.get("priceList_t_c"), dict)
-        else api_data.get("priceList_t_c")
-    )
+    api_pricelist = _pick_display(api_data, "priceList_t_c", "value")
     pdf_pricelist = pdf_data.get("priceList_t_c")
     if not _is_pdf_value_none(pdf_pricelist):
-        results.append(
+        add_result(
             FieldResult(
-                field_name="priceList_t_c",
-                section="Quote Information",
-                expected=api_pricelist,
-                found=pdf_pricelist,
-                match=strings_close(api_pricelist, pdf_pricelist, threshold=0.95),
+                "priceList_t_c",
+                _SEC_QUOTE_INFO,
+                api_pricelist,
+                pdf_pricelist,
+                strings_close(api_pricelist, pdf_pricelist, threshold=0.95),
             )
         )
 
     # Transaction ID (if available)
-    api_tx_candidates = [
+    api_tx_expected = _first_not_none(
         api_data.get("transactionID_t"),
         api_data.get("quoteTransactionID_t_c"),
         api_data.get("bs_id"),
         api_data.get("_id"),
         api_data.get("sourceBS_ID_t_c"),
-    ]
-    api_tx_expected = next((v for v in api_tx_candidates if v is not None), None)
+    )
     pdf_tx = pdf_data.get("transactionID_t")
     if not _is_pdf_value_none(pdf_tx):
-        api_digits = only_digits(str(api_tx_expected) if api_tx_expected else None)
-        pdf_digits = only_digits(str(pdf_tx) if pdf_tx else None)
+        api_tx_s = str(api_tx_expected) if api_tx_expected else None
+        pdf_tx_s = str(pdf_tx) if pdf_tx else None
+        api_digits = only_digits(api_tx_s)
+        pdf_digits = only_digits(pdf_tx_s)
         match = (api_digits == pdf_digits) if (api_digits and pdf_digits) else strings_contain_match(
-            str(api_tx_expected) if api_tx_expected else None,
-            str(pdf_tx) if pdf_tx else None,
+            api_tx_s,
+            pdf_tx_s,
             extract_numbers=True
         )
-        results.append(
+        add_result(
             FieldResult(
-                field_name="transactionID_t",
-                section="Quote Information",
-                expected=api_tx_expected,
-                found=pdf_tx,
-                match=match,
+                "transactionID_t",
+                _SEC_QUOTE_INFO,
+                api_tx_expected,
+                pdf_tx,
+                match,
             )
         )
 
@@ -588,90 +679,67 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     if not _is_pdf_value_none(pdf_quote_number):
         api_str = str(api_quote_number) if api_quote_number is not None else None
         pdf_str = str(pdf_quote_number) if pdf_quote_number is not None else None
-        match = strings_contain_match(api_str, pdf_str, extract_numbers=True) or strings_close(api_str, pdf_str, threshold=0.85)
-        results.append(
+        match = strings_match(api_str, pdf_str, threshold=0.85)
+        add_result(
             FieldResult(
-                field_name="quoteNumber_t_c",
-                section="Quote Information",
-                expected=api_quote_number,
-                found=pdf_quote_number,
-                match=match,
+                "quoteNumber_t_c",
+                _SEC_QUOTE_INFO,
+                api_quote_number,
+                pdf_quote_number,
+                match,
             )
         )
 
     # Additional Header Attributes (if present in PDF)
-    additional_header_fields = [
-        ("freightTerms_t_c", "Freight Terms"),
-        ("contractStartDate_t", "Contract Start Date"),
-        ("contractEndDate_t", "Contract End Date"),
-        ("lastUpdatedDate_t", "Last Updated Date"),
-        ("lastUpdatedBy_t", "Last Updated By"),
-        ("sellingMotion_t_c", "Selling Motion"),
-        ("district_t_c", "District"),
-    ]
-    
-    for field, label in additional_header_fields:
-        api_val = api_data.get(field)
-        if api_val is not None:
-            if isinstance(api_val, dict):
-                api_val = api_val.get("value") or api_val.get("displayValue")
-            pdf_val = pdf_data.get(field)
-            if _is_pdf_value_none(pdf_val):
-                continue
-            api_str = str(api_val) if api_val is not None else None
-            pdf_str = str(pdf_val) if pdf_val is not None else None
-            match = strings_contain_match(api_str, pdf_str, extract_numbers=True) or strings_close(api_str, pdf_str, threshold=0.85)
-            results.append(
-                FieldResult(
-                    field_name=field,
-                    section="Quote Information",
-                    expected=api_str,
-                    found=pdf_str,
-                    match=match,
-                )
+    for field, label in _ADDITIONAL_HEADER_FIELDS:
+        api_str, pdf_str, should_validate = _norm_header_pair(api_data, pdf_data, field)
+        if not should_validate:
+            continue
+        add_result(
+            FieldResult(
+                field,
+                _SEC_QUOTE_INFO,
+                api_str,
+                pdf_str,
+                strings_match(api_str, pdf_str, threshold=0.85),
             )
+        )
     
     # Additional Pricing Attributes (if present in PDF)
-    additional_pricing_fields = [
-        ("extNetPrice_t_c", "Extended Net Price", True),
-        ("quoteDesiredNetPrice_t_c", "Desired Net Price", True),
-        ("quoteDesiredDiscount_t_c", "Desired Discount %", False),
-    ]
-    
-    for field, label, is_currency in additional_pricing_fields:
+    for field, label, is_currency in _ADDITIONAL_PRICING_FIELDS:
         api_val = api_data.get(field)
         pdf_val = pdf_data.get(field)
         if _is_pdf_value_none(pdf_val):
             continue
         if api_val is not None or pdf_val is not None:
             if is_currency:
-                api_parsed = parse_currency(str(api_val) if api_val is not None and not isinstance(api_val, (int, float)) else api_val)
+                api_parsed = parse_currency(api_val)
                 pdf_parsed = pdf_val
-                tolerance = config.validation_rules.numeric_tolerance
+                tolerance = num_tol
             else:
                 try:
                     api_parsed = float(api_val) if api_val is not None else None
                     pdf_parsed = float(pdf_val) if pdf_val is not None else None
-                    tolerance = config.validation_rules.percentage_tolerance
+                    tolerance = pct_tol
                 except (ValueError, TypeError):
                     api_parsed = None
                     pdf_parsed = None
                     tolerance = 0.0
             
-            results.append(
+            add_result(
                 FieldResult(
-                    field_name=field,
-                    section="Quote Information",
-                    expected=round(api_parsed, 2) if api_parsed is not None else None,
-                    found=round(pdf_parsed, 2) if pdf_parsed is not None else None,
-                    match=floats_match(api_parsed, pdf_parsed, tolerance),
+                    field,
+                    _SEC_QUOTE_INFO,
+                    round(api_parsed, 2) if api_parsed is not None else None,
+                    round(pdf_parsed, 2) if pdf_parsed is not None else None,
+                    floats_match(api_parsed, pdf_parsed, tolerance),
                 )
             )
 
     # Extended attribute coverage (50+ additional validations) - if present in PDF
-    for ext_field in EXTENDED_FIELDS:
-        api_raw = api_data.get(ext_field.name)
-        pdf_raw = pdf_data.get(ext_field.name)
+    for name, section, handler, threshold in _EXT_FLAT:
+        api_raw = api_data.get(name)
+        pdf_raw = pdf_data.get(name)
         api_val = _normalize_scalar(api_raw)
         pdf_val = _normalize_scalar(pdf_raw)
         # Skip validation if PDF value is None/empty
@@ -679,18 +747,19 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
             continue
         if api_val is None and pdf_val is None:
             continue
-        expected, found, match = _evaluate_extended_field(ext_field, api_val, pdf_val, config)
-        results.append(
+        expected, found, match = handler(api_val, pdf_val, config, threshold)
+        add_result(
             FieldResult(
-                field_name=ext_field.name,
-                section=ext_field.section,
-                expected=expected,
-                found=found,
-                match=match,
+                name,
+                section,
+                expected,
+                found,
+                match,
             )
         )
 
-    matches = sum(1 for r in results if r.match)
+    # Every check stores a real bool, so summing the flags counts the matches in C
+    matches = sum(map(attrgetter("match"), results))
     mismatches = len(results) - matches
     overall = "PASSED" if mismatches == 0 else "FAILED"
 
@@ -705,85 +774,159 @@ def validate_quote(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[s
     )
 
 
+# Punctuation/whitespace dropped when comparing part numbers loosely
+_PART_PUNCT_TBL = str.maketrans("", "", "-_./ ")
+
+
+def _norm_part(part: Any) -> str:
+    return str(part).translate(_PART_PUNCT_TBL).upper()
+
+
 def _get_api_lines(api_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     # Support api_data["transactionLine"] from main.py (attached) or direct 'items'
     lines_container = api_data.get("transactionLine") or {}
     if isinstance(lines_container, dict) and "items" in lines_container:
-        return list(lines_container.get("items") or [])
-    if isinstance(api_data.get("items"), list):
-        return list(api_data.get("items") or [])
+        lc_items = lines_container["items"]
+        return list(lc_items) if lc_items else []
+    items = api_data.get("items")
+    if isinstance(items, list):
+        return list(items)
     return []
 
 
+def _line_price_result(field_name: str, api_amount: float, pdf_unit: Any, pdf_ext: Any, tolerance: float) -> Optional[FieldResult]:
+    """Compare a line amount against the PDF unit price first, then the extended price.
+
+    Returns None when neither PDF price is available to compare against."""
+    # Try to match against unit price first (most common case for line items)
+    excel_value = None
+    match_found = False
+    
+    if not _is_pdf_value_none(pdf_unit):
+        if floats_match(api_amount, float(pdf_unit), tolerance):
+            excel_value = pdf_unit
+            match_found = True
+    
+    # If unit doesn't match, try extended price
+    if not match_found and not _is_pdf_value_none(pdf_ext):
+        if floats_match(api_amount, float(pdf_ext), tolerance):
+            excel_value = pdf_ext
+            match_found = True
+        else:
+            # If neither matches exactly, prefer unit price for comparison
+            excel_value = pdf_unit if pdf_unit else pdf_ext
+    
+    if excel_value is None:
+        return None
+    return FieldResult(
+        field_name,
+        _SEC_LINES,
+        round(api_amount, 2),
+        round(excel_value, 2) if excel_value else None,
+        match_found,
+    )
+
+
 def validate_line_items(config: AppConfig, api_data: Dict[str, Any], pdf_data: Dict[str, Any], results: List[FieldResult]) -> None:
     pdf_lines: List[Dict[str, Any]] = list(pdf_data.get("line_items") or [])
     api_lines: List[Dict[str, Any]] = _get_api_lines(api_data)
     if not pdf_lines or not api_lines:
         return
 
-    # Index PDF lines by part number for quick lookup
+    # Index PDF lines by part number for quick lookup, plus a normalized key
+    # so "SG5812A-001-48TB" still finds "sg5812a 001 48tb" in OCR'd documents
     pdf_by_part: Dict[str, Dict[str, Any]] = {}
+    pdf_by_norm_part: Dict[str, Dict[str, Any]] = {}
     for row in pdf_lines:
         part = row.get("partNumber")
         if part:
-            pdf_by_part[str(part).strip()] = row
+            part_key = str(part).strip()
+            pdf_by_part[part_key] = row
+            norm_key = _norm_part(part_key)
+            if norm_key:
+                pdf_by_norm_part[norm_key] = row
 
     # Line items count validation removed - not needed
-    
-    # Calculate totals from line items for validation
-    api_calculated_list_total = 0.0
-    api_calculated_net_total = 0.0
-    pdf_calculated_list_total = 0.0
-    pdf_calculated_net_total = 0.0
+
+    num_tol = config.validation_rules.numeric_tolerance
+    pct_tol = config.validation_rules.percentage_tolerance
+    add_result = results.append
+    # Helpers called several times per line, bound to locals for the loop
+    _is_none = _is_pdf_value_none
+    _floats_match = floats_match
+    _parse_currency = parse_currency
+    _FieldResult = FieldResult
 
     # For each API line, compare against matching PDF part
     for line in api_lines:
         api_part = line.get("_part_number") or line.get("_part_display_number") or line.get("_line_display_name")
-        pdf_row = pdf_by_part.get(str(api_part)) if api_part is not None else None
+        if api_part is None:
+            continue
+        # Text form of the part, reused for the lookup, the match and the field names
+        api_part_s = str(api_part)
+        pdf_row = pdf_by_part.get(api_part_s)
+        if pdf_row is None:
+            pdf_row = pdf_by_norm_part.get(_norm_part(api_part_s))
 
         # If PDF doesn't have this part number, skip all validations for this line item
-        if pdf_row is None or _is_pdf_value_none(pdf_row.get("partNumber")):
+        if pdf_row is None:
+            continue
+        pdf_part = pdf_row.get("partNumber")
+        if _is_none(pdf_part):
             continue
 
-        # Part number presence (only validate if we have a PDF row)
+        # From here on pdf_row and pdf_part are always set
+        pdf_qty = pdf_row.get("quantity")
+        pdf_ext_list = pdf_row.get("extendedListPrice")
+        pdf_ext_net = pdf_row.get("extendedNetPrice")
+        pdf_unit_list = pdf_row.get("unitListPrice")
+        pdf_unit_net = pdf_row.get("unitNetPrice")
+        pdf_disc = pdf_row.get("discountPercent")
+        # API line amounts consulted by the calculation and pricing checks below
+        lp_lc = line.get("listPrice_l_c")
+        np_lc = line.get("netPrice_l_c")
+        rollup_net = line.get("rollUpNetPrice_l_c")
+
+        # Part number presence
         # Use containment matching for part numbers (e.g., "SG5812A-001-48TB" vs "SG5812A-001-48TB-PR")
-        pdf_part = pdf_row.get("partNumber")
-        if not _is_pdf_value_none(pdf_part):
-            api_part_str = str(api_part) if api_part is not None else None
-            pdf_part_str = str(pdf_part) if pdf_part is not None else None
-            # Use containment match - if one contains the other, it's a match
-            match = strings_contain_match(api_part_str, pdf_part_str, extract_numbers=True) or strings_close(api_part_str, pdf_part_str, threshold=0.85)
-            results.append(
-                FieldResult(
-                    field_name="_part_number",
-                    section="Lines",
-                    expected=api_part,
-                    found=pdf_part,
-                    match=match,
-                )
+        pdf_part_str = str(pdf_part)
+        # Rows are looked up by exact part number, so identical text is the common case
+        if api_part_s == pdf_part_str:
+            match = True
+        elif api_part_s and pdf_part_str and (api_part_s in pdf_part_str or pdf_part_str in api_part_s):
+            # Suffix variants such as "-PR" contain each other; no need for similarity scoring
+            match = True
+        elif _norm_part(api_part_s) == _norm_part(pdf_part_str):
+            # Row found through the normalized index ("A.B.C.D" vs "ABCD"): same part
+            match = True
+        else:
+            # Fall back to key-phrase / number overlap and similarity
+            match = strings_match(api_part_s, pdf_part_str, threshold=0.85)
+        add_result(
+            _FieldResult(
+                "_part_number",
+                _SEC_LINES,
+                api_part,
+                pdf_part,
+                match,
             )
+        )
 
         # Quantity exact
         api_qty = line.get("_price_quantity") or line.get("_line_bom_item_quantity")
-        pdf_qty = pdf_row.get("quantity") if pdf_row else None
-        if not _is_pdf_value_none(pdf_qty):
-            results.append(
-                FieldResult(
-                    field_name="quantity",
-                    section="Lines",
-                    expected=api_qty,
-                    found=pdf_qty,
-                    match=(int(api_qty) == int(pdf_qty)) if (api_qty is not None and pdf_qty is not None) else False,
+        if not _is_none(pdf_qty):
+            add_result(
+                _FieldResult(
+                    "quantity",
+                    _SEC_LINES,
+                    api_qty,
+                    pdf_qty,
+                    (int(api_qty) == int(pdf_qty)) if (api_qty is not None and pdf_qty is not None) else False,
                 )
             )
 
         # Unit List Price - validation removed, not needed
-        api_ulp = None
-        for key in ["_price_item_price_each", "_price_unit_price_each", "_price_list_price_each"]:
-            val = line.get(key)
-            if isinstance(val, dict) and val.get("value") is not None:
-                api_ulp = val.get("value")
-                break
+        api_ulp = _unwrap(line, _ULP_KEYS, allow_bare=False)
 
         # Unit Net Price - validation removed, not needed
         api_unp = line.get("netPrice_l")
@@ -791,88 +934,63 @@ def validate_line_items(config: AppConfig, api_data: Dict[str, Any], pdf_data: D
 
         # Extended List Price - validation removed, not needed
         # Still extract for calculation validations
-        api_xlp = None
-        for key in ["_price_extended_price", "extendedListPrice", "listAmount_l"]:
-            val = line.get(key)
-            if isinstance(val, dict) and val.get("value") is not None:
-                api_xlp = val.get("value")
-                break
-            elif isinstance(val, (int, float)) and val is not None:
-                api_xlp = val
-                break
+        api_xlp = _unwrap(line, _XLP_KEYS)
 
         # Extended Net Price - Check ALL possible fields
-        api_xnp = None
-        for key in ["netAmount_l", "netAmountRollup_l", "netPriceRollup_l", "extendedNetPriceUSD_l_c", "rollUpNetPrice_l_c"]:
-            val = line.get(key)
-            if isinstance(val, dict) and val.get("value") is not None:
-                api_xnp = val.get("value")
-                break
-            elif isinstance(val, (int, float)) and val is not None and val != 0:
-                api_xnp = val
-                break
-        
-        # Also check listPrice_l_c for extended list
-        if api_xnp is None:
-            api_list_price = line.get("listPrice_l_c")
-            if isinstance(api_list_price, (int, float)) and api_list_price != 0:
-                # This might be extended list, check if it matches calculation
-                pass
+        api_xnp = _unwrap(line, _XNP_KEYS, allow_zero=False)
         
-        pdf_xnp = pdf_row.get("extendedNetPrice") if pdf_row else None
-        if not _is_pdf_value_none(pdf_xnp):
-            results.append(
-                FieldResult(
-                    field_name="extendedNetPrice",
-                    section="Lines",
-                    expected=round(api_xnp, 2) if api_xnp is not None else None,
-                    found=round(pdf_xnp, 2) if pdf_xnp is not None else None,
-                    match=floats_match(
-                        parse_currency(str(api_xnp) if api_xnp is not None else None),
-                        pdf_xnp,
-                        config.validation_rules.numeric_tolerance,
-                    ),
-                    message=f"CRITICAL: Extended Net Price = Quantity × Unit Net Price" if not floats_match(
-                        parse_currency(str(api_xnp) if api_xnp is not None else None),
-                        pdf_xnp,
-                        config.validation_rules.numeric_tolerance,
-                    ) else None,
+        if not _is_none(pdf_ext_net):
+            xnp_expected = _parse_currency(api_xnp)
+            xnp_match = _floats_match(xnp_expected, pdf_ext_net, num_tol)
+            add_result(
+                _FieldResult(
+                    "extendedNetPrice",
+                    _SEC_LINES,
+                    round(api_xnp, 2) if api_xnp is not None else None,
+                    round(pdf_ext_net, 2) if pdf_ext_net is not None else None,
+                    xnp_match,
+                    message="CRITICAL: Extended Net Price = Quantity × Unit Net Price" if not xnp_match else None,
                 )
             )
 
         # CRITICAL CALCULATION VALIDATION: Extended List = Quantity × Unit List
-        if api_qty and api_ulp and pdf_row:
-            calculated_ext_list = float(api_qty) * float(api_ulp)
-            actual_ext_list = api_xlp or pdf_row.get("extendedListPrice")
-            if actual_ext_list and not _is_pdf_value_none(actual_ext_list):
-                actual_ext_list = parse_currency(str(actual_ext_list) if not isinstance(actual_ext_list, (int, float)) else actual_ext_list)
-                calc_match = floats_match(calculated_ext_list, actual_ext_list, config.validation_rules.numeric_tolerance)
-                results.append(
-                    FieldResult(
-                        field_name=f"calc_ext_list_{api_part}",
-                        section="Calculations",
-                        expected=round(calculated_ext_list, 2),
-                        found=round(actual_ext_list, 2) if actual_ext_list else None,
-                        match=calc_match,
+        # float(api_qty) is shared by both calculations, converted on first use
+        api_qty_f = None
+        if api_qty and api_ulp:
+            api_qty_f = float(api_qty)
+            calculated_ext_list = api_qty_f * float(api_ulp)
+            actual_ext_list = api_xlp or pdf_ext_list
+            if actual_ext_list and not _is_none(actual_ext_list):
+                actual_ext_list = _parse_currency(actual_ext_list)
+                calc_match = _floats_match(calculated_ext_list, actual_ext_list, num_tol)
+                add_result(
+                    _FieldResult(
+                        f"calc_ext_list_{api_part_s}",
+                        _SEC_CALCULATIONS,
+                        round(calculated_ext_list, 2),
+                        round(actual_ext_list, 2) if actual_ext_list else None,
+                        calc_match,
                         message=f"Qty({api_qty}) × Unit List({api_ulp}) = {calculated_ext_list:.2f}, Found: {actual_ext_list:.2f}" if not calc_match else None,
                     )
                 )
 
         # CRITICAL CALCULATION VALIDATION: Extended Net = Quantity × Unit Net
-        api_unp_val_for_calc = api_unp_val or (line.get("netPrice_l_c") if isinstance(line.get("netPrice_l_c"), (int, float)) else None)
-        if api_qty and api_unp_val_for_calc and pdf_row:
-            calculated_ext_net = float(api_qty) * float(api_unp_val_for_calc)
-            actual_ext_net = api_xnp or pdf_row.get("extendedNetPrice")
-            if actual_ext_net and not _is_pdf_value_none(actual_ext_net):
-                actual_ext_net = parse_currency(str(actual_ext_net) if not isinstance(actual_ext_net, (int, float)) else actual_ext_net)
-                calc_match = floats_match(calculated_ext_net, actual_ext_net, config.validation_rules.numeric_tolerance)
-                results.append(
-                    FieldResult(
-                        field_name=f"calc_ext_net_{api_part}",
-                        section="Calculations",
-                        expected=round(calculated_ext_net, 2),
-                        found=round(actual_ext_net, 2) if actual_ext_net else None,
-                        match=calc_match,
+        api_unp_val_for_calc = api_unp_val or (np_lc if type(np_lc) in _NUMERIC_TYPES else None)
+        if api_qty and api_unp_val_for_calc:
+            if api_qty_f is None:
+                api_qty_f = float(api_qty)
+            calculated_ext_net = api_qty_f * float(api_unp_val_for_calc)
+            actual_ext_net = api_xnp or pdf_ext_net
+            if actual_ext_net and not _is_none(actual_ext_net):
+                actual_ext_net = _parse_currency(actual_ext_net)
+                calc_match = _floats_match(calculated_ext_net, actual_ext_net, num_tol)
+                add_result(
+                    _FieldResult(
+                        f"calc_ext_net_{api_part_s}",
+                        _SEC_CALCULATIONS,
+                        round(calculated_ext_net, 2),
+                        round(actual_ext_net, 2) if actual_ext_net else None,
+                        calc_match,
                         message=f"Qty({api_qty}) × Unit Net({api_unp_val_for_calc}) = {calculated_ext_net:.2f}, Found: {actual_ext_net:.2f}" if not calc_match else None,
                     )
                 )
@@ -881,118 +999,31 @@ def validate_line_items(config: AppConfig, api_data: Dict[str, Any], pdf_data: D
         api_disc = line.get("discountPercent_l") or line.get("currentDiscount_l_c") or line.get("currentDiscountEndCustomer_l_c")
         if isinstance(api_disc, dict):
             api_disc = api_disc.get("value")
-        pdf_disc = pdf_row.get("discountPercent") if pdf_row else None
-        if not _is_pdf_value_none(pdf_disc):
-            results.append(
-                FieldResult(
-                    field_name="discountPercent",
-                    section="Lines",
-                    expected=api_disc,
-                    found=pdf_disc,
-                    match=floats_match(
+        if not _is_none(pdf_disc):
+            add_result(
+                _FieldResult(
+                    "discountPercent",
+                    _SEC_LINES,
+                    api_disc,
+                    pdf_disc,
+                    _floats_match(
                         float(api_disc) if api_disc is not None else None,
                         float(pdf_disc) if pdf_disc is not None else None,
-                        config.validation_rules.percentage_tolerance,
+                        pct_tol,
                     ),
                 )
             )
         
-        # Accumulate totals for grand total validation
-        if api_xlp:
-            try:
-                api_calculated_list_total += float(api_xlp)
-            except (ValueError, TypeError):
-                pass
-        if api_xnp:
-            try:
-                api_calculated_net_total += float(api_xnp)
-            except (ValueError, TypeError):
-                pass
-        
-        if pdf_row:
-            pdf_ext_list = pdf_row.get("extendedListPrice")
-            pdf_ext_net = pdf_row.get("extendedNetPrice")
-            if pdf_ext_list:
-                try:
-                    pdf_calculated_list_total += float(pdf_ext_list)
-                except (ValueError, TypeError):
-                    pass
-            if pdf_ext_net:
-                try:
-                    pdf_calculated_net_total += float(pdf_ext_net)
-                except (ValueError, TypeError):
-                    pass
-        
         # Additional pricing fields validation
-        # Check listPrice_l_c - compare against both unit and extended to find the best match
-        api_list_price_line = line.get("listPrice_l_c")
-        if isinstance(api_list_price_line, (int, float)) and api_list_price_line != 0:
-            pdf_unit_list = pdf_row.get("unitListPrice") if pdf_row else None
-            pdf_ext_list = pdf_row.get("extendedListPrice") if pdf_row else None
-            
-            # Try to match against unit price first (most common case for line items)
-            excel_value = None
-            match_found = False
-            
-            if not _is_pdf_value_none(pdf_unit_list):
-                if floats_match(float(api_list_price_line), float(pdf_unit_list), config.validation_rules.numeric_tolerance):
-                    excel_value = pdf_unit_list
-                    match_found = True
-            
-            # If unit doesn't match, try extended price
-            if not match_found and not _is_pdf_value_none(pdf_ext_list):
-                if floats_match(float(api_list_price_line), float(pdf_ext_list), config.validation_rules.numeric_tolerance):
-                    excel_value = pdf_ext_list
-                    match_found = True
-                elif excel_value is None:
-                    # If neither matches exactly, prefer unit price for comparison
-                    excel_value = pdf_unit_list if pdf_unit_list else pdf_ext_list
-            
-            if excel_value is not None:
-                results.append(
-                    FieldResult(
-                        field_name=f"listPrice_l_c_{api_part}",
-                        section="Lines",
-                        expected=round(api_list_price_line, 2),
-                        found=round(excel_value, 2) if excel_value else None,
-                        match=match_found,
-                    )
-                )
-        
-        # Check rollUpNetPrice_l_c - compare against both unit and extended to find the best match
-        api_rollup_net = line.get("rollUpNetPrice_l_c")
-        if isinstance(api_rollup_net, (int, float)) and api_rollup_net != 0:
-            pdf_unit_net = pdf_row.get("unitNetPrice") if pdf_row else None
-            pdf_ext_net = pdf_row.get("extendedNetPrice") if pdf_row else None
-            
-            # Try to match against unit price first (most common case for line items)
-            excel_value = None
-            match_found = False
-            
-            if not _is_pdf_value_none(pdf_unit_net):
-                if floats_match(float(api_rollup_net), float(pdf_unit_net), config.validation_rules.numeric_tolerance):
-                    excel_value = pdf_unit_net
-                    match_found = True
-            
-            # If unit doesn't match, try extended price
-            if not match_found and not _is_pdf_value_none(pdf_ext_net):
-                if floats_match(float(api_rollup_net), float(pdf_ext_net), config.validation_rules.numeric_tolerance):
-                    excel_value = pdf_ext_net
-                    match_found = True
-                elif excel_value is None:
-                    # If neither matches exactly, prefer unit price for comparison
-                    excel_value = pdf_unit_net if pdf_unit_net else pdf_ext_net
-            
-            if excel_value is not None:
-                results.append(
-                    FieldResult(
-                        field_name=f"rollUpNetPrice_l_c_{api_part}",
-                        section="Lines",
-                        expected=round(api_rollup_net, 2),
-                        found=round(excel_value, 2) if excel_value else None,
-                        match=match_found,
-                    )
-                )
+        # listPrice_l_c / rollUpNetPrice_l_c may be unit or extended - compare against both
+        for field_prefix, api_amount, pdf_unit, pdf_ext in (
+            ("listPrice_l_c", lp_lc, pdf_unit_list, pdf_ext_list),
+            ("rollUpNetPrice_l_c", rollup_net, pdf_unit_net, pdf_ext_net),
+        ):
+            if type(api_amount) in _NUMERIC_TYPES and api_amount != 0:
+                price_result = _line_price_result(f"{field_prefix}_{api_part_s}", api_amount, pdf_unit, pdf_ext, num_tol)
+                if price_result is not None:
+                    add_result(price_result)
         
         # rollUpResUnitNetPrice_l_c validation removed - not needed
         